@@ -1,7 +1,14 @@
 from fastapi import FastAPI
-from routers import array_router, ppt_email_router
+from fastapi.responses import ORJSONResponse
+from routers import array_router, ppt_email_router, lifespan
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 app.include_router(array_router)
 app.include_router(ppt_email_router)
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop event loop + httptools parser (both ship with uvicorn[standard])
+    uvicorn.run("app:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
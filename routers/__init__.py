@@ -1,4 +1,4 @@
 from .array_converter import router as array_router
-from .ppt_email import router as ppt_email_router
+from .ppt_email import router as ppt_email_router, lifespan
 
-__all__ = ["array_router", "ppt_email_router"]
+__all__ = ["array_router", "ppt_email_router", "lifespan"]
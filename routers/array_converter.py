@@ -1,22 +1,95 @@
+import json
+import re
+
+import ijson
+import orjson
 from fastapi import APIRouter, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 
 router = APIRouter(tags=["Array Converter"])
 
+# orjson reads integers beyond 64 bits as floats and can't write them back. Bodies
+# with a 20+ digit run may hold one, so they go through stdlib json to stay exact
+# (a match inside a string or a long fraction just takes the slower path).
+_RE_LONG_DIGITS = re.compile(rb"\d{20,}")
+
 @router.get("/")
 def root():
     return {"message": "Welcome to Array Converter API!"}
 
 @router.post("/convert")
-async def convert_arrays(request: Request):
-    body = await request.json()
+async def convert_arrays(request: Request, compact: bool = False):
+    raw = await request.body()
+    exact = _RE_LONG_DIGITS.search(raw) is not None
+    body = json.loads(raw) if exact else orjson.loads(raw)
+    response_class = JSONResponse if exact else ORJSONResponse
     header = body.get("header")
     data = body.get("data")
 
-    if not header or not data:
-        return JSONResponse(
+    if not header or data is None:
+        return ORJSONResponse(
             content={"error": "Both 'header' and 'data' are required."},
             status_code=400
         )
 
-    return [dict(zip(header, row)) for row in data]
+    if not data:
+        return response_class(content=[])
+
+    # zip() would silently truncate rows that don't match the header
+    width = len(header)
+    if any(len(row) != width for row in data):
+        return ORJSONResponse(
+            content={"error": f"Every row in 'data' must have {width} values to match 'header'."},
+            status_code=400
+        )
+
+    # compact=true echoes the columnar shape and skips building a dict per row
+    if compact:
+        return response_class(content={"header": header, "rows": data})
+
+    keys = tuple(header)
+    return response_class(content=list(map(lambda row, k=keys: dict(zip(k, row)), data)))
+
+@router.post("/convert-stream")
+async def convert_arrays_stream(request: Request):
+    """
+    Same as /convert, but pulls rows out one at a time and streams NDJSON.
+
+    The 200 is sent before 'data' is fully read, so a bad row (wrong length, or
+    JSON that can't be parsed, e.g. an integer beyond 64 bits) ends the stream
+    with a final {"error": "..."} line instead of a partial or wrong record.
+    """
+    raw = await request.body()
+    try:
+        header = next(ijson.items(raw, "header", use_float=True), None)
+    except ijson.JSONError as e:
+        return ORJSONResponse(
+            content={"error": f"Invalid JSON: {e}"},
+            status_code=400
+        )
+
+    if not header:
+        return ORJSONResponse(
+            content={"error": "'header' is required."},
+            status_code=400
+        )
+
+    keys = tuple(header)
+    width = len(keys)
+
+    def rows():
+        try:
+            for row in ijson.items(raw, "data.item", use_float=True):
+                # zip() would silently truncate rows that don't match the header
+                if not isinstance(row, list) or len(row) != width:
+                    yield orjson.dumps(
+                        {"error": f"Every row in 'data' must have {width} values to match 'header'."}
+                    ) + b"\n"
+                    return
+                # Non-string header values become string keys, as /convert's ORJSONResponse does
+                yield orjson.dumps(dict(zip(keys, row)), option=orjson.OPT_NON_STR_KEYS) + b"\n"
+        except (ijson.JSONError, orjson.JSONEncodeError) as e:
+            # ijson's C backend rejects >64-bit integers, the Python one hands them to orjson
+            yield orjson.dumps({"error": f"Could not convert 'data': {e}"}) + b"\n"
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
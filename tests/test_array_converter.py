@@ -0,0 +1,52 @@
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers.array_converter import router
+
+client = TestClient(FastAPI(routes=router.routes))
+
+
+def _stream_rows(body):
+    resp = client.post("/convert-stream", json=body)
+    assert resp.status_code == 200
+    return [orjson.loads(line) for line in resp.content.splitlines()]
+
+
+def test_convert_builds_row_objects():
+    resp = client.post("/convert", json={"header": ["a", "b"], "data": [[1, 2], [3, 4]]})
+    assert resp.json() == [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+
+@pytest.mark.parametrize("header", [["a", "b"], [2023, 2024], [1.5, "x"]])
+def test_convert_stream_matches_convert(header):
+    body = {"header": header, "data": [[1, 2.5], [-3, "x"]]}
+    assert _stream_rows(body) == client.post("/convert", json=body).json()
+
+
+def test_convert_stream_requires_header():
+    assert client.post("/convert-stream", json={"data": [[1]]}).status_code == 400
+
+
+def test_convert_keeps_integers_beyond_64_bits_exact():
+    body = b'{"header": ["a", "b"], "data": [[12345678901234567890123, 1.5]]}'
+    resp = client.post("/convert", content=body, headers={"content-type": "application/json"})
+    assert resp.status_code == 200
+    assert resp.json() == [{"a": 12345678901234567890123, "b": 1.5}]
+
+
+def test_convert_stream_ends_with_error_line_on_ragged_row():
+    lines = _stream_rows({"header": ["a", "b"], "data": [[1, 2], [3], [4, 5]]})
+    assert lines[0] == {"a": 1, "b": 2}
+    assert list(lines[1]) == ["error"]
+    assert len(lines) == 2
+
+
+def test_convert_stream_ends_with_error_line_on_unparseable_data():
+    body = b'{"header": ["a"], "data": [[1], [12345678901234567890123], [2]]}'
+    resp = client.post("/convert-stream", content=body, headers={"content-type": "application/json"})
+    lines = [orjson.loads(line) for line in resp.content.splitlines()]
+    assert lines[0] == {"a": 1}
+    assert list(lines[-1]) == ["error"]
+    assert len(lines) == 2
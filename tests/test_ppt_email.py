@@ -0,0 +1,55 @@
+import zipfile
+
+import pytest
+from lxml import etree
+from pydantic import ValidationError
+
+from routers.ppt_email import PPTEmailRequest, create_pptx_buffer
+
+_RED = "FF0000"
+
+
+def _request(**overrides):
+    fields = {
+        "business_name": "Philips EQ",
+        "summary": "1. Finding",
+        "data": [{"Market": "CEE", "YTD": -1.5}],
+        "email": "test@philips.com",
+    }
+    fields.update(overrides)
+    return PPTEmailRequest(**fields)
+
+
+@pytest.mark.parametrize("spec", [None, "", ",", ",.2f", "_.1e", ".0%"])
+def test_number_format_accepts_allowlisted_specs(spec):
+    assert _request(number_format=spec).number_format == spec
+
+
+@pytest.mark.parametrize("spec", ["200000000", ".99999999f", ">20,.2f", "d", ".2", "%q"])
+def test_number_format_rejects_other_specs(spec):
+    with pytest.raises(ValidationError):
+        _request(number_format=spec)
+
+
+def _table_cells(data, number_format=None):
+    """(text, is_red) for each data cell of the deck's table slide"""
+    with create_pptx_buffer("Philips EQ", "1. Finding", data, number_format) as buf:
+        slide = etree.fromstring(zipfile.ZipFile(buf).read("ppt/slides/slide3.xml"))
+    ns = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
+    rows = slide.findall(".//a:tbl/a:tr", ns)[1:]
+    return [
+        ("".join(tc.xpath(".//a:t/text()", namespaces=ns)),
+         bool(tc.xpath(f".//a:defRPr//a:srgbClr[@val='{_RED}']", namespaces=ns)))
+        for row in rows
+        for tc in row.findall("a:tc", ns)
+    ]
+
+
+def test_number_format_renders_numeric_cells():
+    cells = _table_cells([{"int": 1234567, "float": 0.5, "neg": -3, "label": "North"}], ",.2f")
+    assert cells == [("1,234,567.00", False), ("0.50", False), ("-3.00", True), ("North", False)]
+
+
+def test_number_format_falls_back_for_ints_beyond_float_range():
+    big = 10**400
+    assert _table_cells([{"k": big}, {"k": -big}], ",.2f") == [(str(big), False), (str(-big), True)]
@@ -0,0 +1,92 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+import routers.ppt_email as ppt_email
+from app import app
+
+BATCH_URL = "/api/v1/generate-and-send-batch"
+
+
+def _item(business_name, **overrides):
+    item = {
+        "business_name": business_name,
+        "summary": "1. Finding",
+        "data": [{"Market": "CEE", "YTD": -1.5}],
+        "email": "test@philips.com",
+    }
+    item.update(overrides)
+    return item
+
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """
+    Route the shared HTTP client to a MockTransport. Tests set `token_status`,
+    and `email_status` per recipient, on the returned dict.
+    """
+    api = {"token_status": 200, "email_status": {}, "emails": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url == ppt_email.TOKEN_URL:
+            return httpx.Response(api["token_status"], json={"access_token": "t", "expires_in": 3600})
+        api["emails"] += 1
+        status = next((s for to, s in api["email_status"].items() if to.encode() in request.content), 200)
+        return httpx.Response(status, json={})
+
+    monkeypatch.setattr(ppt_email, "CLIENT_SECRET", "secret")
+    monkeypatch.setattr(ppt_email, "_TOKEN_CACHE", {})
+    app.dependency_overrides[ppt_email.get_http_client] = (
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    yield api
+    app.dependency_overrides.clear()
+
+
+def test_batch_reports_each_item_and_the_step_that_failed(mock_api, monkeypatch):
+    build_pptx = ppt_email.build_pptx
+
+    async def build_or_fail(business_name, *args):
+        if business_name == "Broken":
+            raise RuntimeError("boom")
+        return await build_pptx(business_name, *args)
+
+    monkeypatch.setattr(ppt_email, "build_pptx", build_or_fail)
+    mock_api["email_status"] = {"rejected@philips.com": 503}
+
+    resp = TestClient(app).post(BATCH_URL, json={"items": [
+        _item("Good"),
+        _item("Broken"),
+        _item("Bounced", email="rejected@philips.com"),
+    ]})
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["success"] is False
+    assert body["message"] == "1 of 3 emails sent successfully"
+    good, broken, bounced = body["results"]
+    assert good["success"] is True and good["email_status_code"] == 200
+    assert broken["success"] is False and broken["message"] == "PPTX generation failed: boom"
+    assert broken["email_status_code"] is None
+    assert bounced["success"] is False and bounced["message"].startswith("Email sending failed:")
+    assert bounced["email_status_code"] == 503
+    assert mock_api["emails"] == 2
+
+
+def test_batch_fails_with_401_when_authentication_fails(mock_api):
+    mock_api["token_status"] = 400
+
+    resp = TestClient(app).post(BATCH_URL, json={"items": [_item("Good")]})
+
+    assert resp.status_code == 401
+    assert resp.json()["detail"].startswith("Authentication failed:")
+    assert mock_api["emails"] == 0
+
+
+def test_batch_rejects_too_many_items(mock_api):
+    items = [_item(f"BU {i}") for i in range(ppt_email.EMAIL_BATCH_MAX_ITEMS + 1)]
+
+    resp = TestClient(app).post(BATCH_URL, json={"items": items})
+
+    assert resp.status_code == 422
+    assert mock_api["emails"] == 0